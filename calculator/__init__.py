@@ -1,11 +1,21 @@
-from tokenizer import Invalid, InvalidTokenError, TokenError, UnexpectedTokenError
-from .tokenizer import (
-    Number,
-    Operator,
-    Parenthesis,
-    Tokenizer,
-    UnexpectedEndOfExpressionError,
+import operator
+import re
+from functools import lru_cache
+from typing import Tuple
+
+from tokenizer import (
+    EOF,
+    KIND_EOF,
+    KIND_INVALID,
+    KIND_NUMBER,
+    KIND_OPERATOR,
+    KIND_PARENTHESIS,
+    Invalid,
+    InvalidTokenError,
+    TokenError,
+    UnexpectedTokenError,
 )
+from .tokenizer import Tokenizer, UnexpectedEndOfExpressionError
 
 # context-free grammar for the arithmetic operation parsing logic
 
@@ -15,6 +25,44 @@ from .tokenizer import (
 #       base -> number | {"-"} "(" expression ")"
 #     number -> FLOAT_PATTERN
 
+# Expressions compile to a flat postfix bytecode: LOAD is followed by an index
+# into the constants tuple, every other opcode operates on the value stack.
+# Compilation is memoized per expression string so repeated evaluations skip
+# tokenization and parsing entirely.
+LOAD, ADD, SUB, MUL, DIV, POW, NEG = range(7)
+
+# Bytecode, constants, and the maximum value-stack depth the program reaches,
+# so _run can preallocate its stack instead of growing it per push.
+Program = Tuple[Tuple[int, ...], Tuple[float, ...], int]
+
+# Binary operator table for precedence climbing: value -> (precedence,
+# right-associative, opcode). Unary minus binds tighter than "*"/"/" but
+# looser than exponentiation, matching Python's own grammar.
+_BINARY_OPS = {
+    "+": (1, False, ADD),
+    "-": (1, False, SUB),
+    "*": (2, False, MUL),
+    "/": (2, False, DIV),
+    "**": (4, True, POW),
+    "^": (4, True, POW),
+}
+_UNARY_PREC = 3
+
+# Every character a valid expression can contain. Longer inputs are rejected
+# with one C-level sweep before tokenization; short ones aren't worth the
+# extra pass.
+_VALID_CHARS = re.compile(r"[\s0-9.+\-*/^()eE]*", re.ASCII)
+
+# C-level implementations of the binary opcodes, used when applying them
+# outside the interpreter loop (e.g. constant folding at compile time).
+_APPLY = {
+    ADD: operator.add,
+    SUB: operator.sub,
+    MUL: operator.mul,
+    DIV: operator.truediv,
+    POW: operator.pow,
+}
+
 
 def evaluate(expression: str) -> float:
     """
@@ -31,16 +79,8 @@ def evaluate(expression: str) -> float:
         UnexpectedEndOfExpressionError: If the expression ends unexpectedly (i.e., insufficient values for operation, mismatched brackets, etc.).
         UnexpectedTokenError: If there are one or more unexpected tokens at the end of the expression.
     """
-    tokens = Tokenizer(expression)
     try:
-        result = _expression(tokens)
-        match (token := next(tokens, None)):
-            case None:
-                pass
-            case Invalid():
-                raise InvalidTokenError(token)
-            case _:
-                raise UnexpectedTokenError(token)
+        code, consts, depth = _compile(expression)
     except TokenError as e:
         print(
             rf"""Invalid expression! {e}
@@ -49,120 +89,290 @@ def evaluate(expression: str) -> float:
         )
         raise e
 
-    return result
+    return _run(code, consts, depth)
 
 
-def _expression(tokens: Tokenizer) -> float:
+def evaluate_compiled(expression: str) -> float:
     """
-    Parse and evaluate an expression, handling addition and subtraction.
+    Evaluate an arithmetic expression through CPython's own eval loop.
+
+    The expression is validated by the regular compile pipeline, then
+    regenerated as Python source and compiled to a native code object
+    (cached per expression string). Repeated evaluations dispatch each
+    operator in C rather than through the bytecode interpreter in _run.
 
     Args:
-        tokens (TokenStream): An iterator of tokens representing the expression.
+        expression (str): The arithmetic expression to evaluate.
 
     Returns:
-        float: The result of the parsed expression.
+        float: The result of the evaluated expression.
 
     Raises:
-        UnexpectedEndOfExpressionError: If there are unexpected tokens at the end of the expression.
-        UnexpectedTokenError: If there is an invalid token in the expression.
+        InvalidTokenError: If an invalid token is encountered.
+        UnexpectedEndOfExpressionError: If the expression ends unexpectedly.
+        UnexpectedTokenError: If a token appears where it is not expected.
+    """
+    return eval(_compile_native(expression), {"__builtins__": {}}, {})
+
+
+@lru_cache(maxsize=1024)
+def _compile_native(expression: str):
     """
-    term = _term(tokens)
+    Regenerate an expression as Python source and compile it, memoized per
+    expression string.
+
+    Validation runs through _compile first so malformed input raises the
+    same errors as the interpreted path. Number literals are parenthesized
+    so signed literals like "-2" keep their tokenized meaning (a single
+    negative number binds tighter than "**"), and "^" is rewritten to "**".
+
+    Args:
+        expression (str): The arithmetic expression to compile.
 
-    match token := next(tokens, None):
-        case Operator("+"):
-            return term + _expression(tokens)
-        case Operator("-"):
-            return term - _expression(tokens)
-        case None:
-            return term
-        case _:
-            tokens.reinsert(token)
-            return term
+    Returns:
+        The compiled code object for the expression.
+    """
+    _compile(expression)
+    parts = []
+    for token in Tokenizer(expression):
+        if token.kind == KIND_NUMBER:
+            parts.append(f"({token.value!r})")
+        elif token.value == "^":
+            parts.append("**")
+        else:
+            parts.append(token.value)
+    return compile(" ".join(parts), "<expression>", "eval")
 
 
-def _term(tokens: Tokenizer) -> float:
+@lru_cache(maxsize=1024)
+def _compile(expression: str) -> Program:
     """
-    Parse and evaluate a term, handling multiplication and division.
+    Compile an expression into postfix bytecode, memoized per expression string.
 
     Args:
-        tokens (TokenStream): An iterator of tokens representing the expression.
+        expression (str): The arithmetic expression to compile.
 
     Returns:
-        float: The result of the parsed term.
+        Program: The bytecode and its constants tuple.
 
     Raises:
-        UnexpectedEndOfExpressionError: If there are unexpected tokens at the end of the expression.
-        UnexpectedTokenError: If there is an invalid token in the expression.
+        InvalidTokenError: If an invalid token is encountered.
+        UnexpectedEndOfExpressionError: If the expression ends unexpectedly.
+        UnexpectedTokenError: If there are one or more unexpected tokens at the end of the expression.
+    """
+    if len(expression) >= 32:
+        end = _VALID_CHARS.match(expression).end()
+        if end != len(expression):
+            raise InvalidTokenError(Invalid(expression[end], end, end + 1))
+    code: list[int] = []
+    consts: list[float] = []
+    tokens = Tokenizer(expression)
+    _parse(tokens, code, consts)
+    return tuple(code), tuple(consts), _max_depth(code)
+
+
+def _emit_binary(code: list[int], consts: list[float], op: int) -> None:
+    """
+    Emit a binary opcode, folding it at compile time when both operands are
+    constants already at the top of the pool (i.e. the tail of the bytecode is
+    the two LOADs that produced them).
+
+    Args:
+        code (list[int]): The bytecode being emitted.
+        consts (list[float]): The constants pool being emitted.
+        op (int): The binary opcode to emit.
+    """
+    if (
+        len(code) >= 4
+        and code[-4] == LOAD
+        and code[-2] == LOAD
+        and code[-3] == len(consts) - 2
+        and code[-1] == len(consts) - 1
+    ):
+        right = consts.pop()
+        left = consts.pop()
+        value = _APPLY[op](left, right)
+        del code[-2:]
+        code[-1] = len(consts)
+        consts.append(value)
+    else:
+        code.append(op)
+
+
+def _emit_neg(code: list[int], consts: list[float]) -> None:
     """
-    factor = _factor(tokens)
+    Emit a NEG opcode, folding it into the constant it negates when the tail
+    of the bytecode is the LOAD that produced it.
 
-    match token := next(tokens, None):
-        case Operator("*"):
-            return factor * _factor(tokens)
-        case Operator("/"):
-            return factor / _factor(tokens)
-        case None:
-            return factor
-        case _:
-            tokens.reinsert(token)
-            return factor
+    Args:
+        code (list[int]): The bytecode being emitted.
+        consts (list[float]): The constants pool being emitted.
+    """
+    if len(code) >= 2 and code[-2] == LOAD and code[-1] == len(consts) - 1:
+        consts[-1] = -consts[-1]
+    else:
+        code.append(NEG)
 
 
-def _factor(tokens: Tokenizer) -> float:
+def _max_depth(code: list[int]) -> int:
     """
-    Parse and evaluate a factor, handling exponentiation.
+    Compute the maximum value-stack depth a bytecode sequence reaches.
 
     Args:
-        tokens (TokenStream): An iterator of tokens representing the expression.
+        code (list[int]): The bytecode to scan.
 
     Returns:
-        float: The result of the parsed factor.
+        int: The deepest the value stack gets while executing the program.
+    """
+    depth = max_depth = 0
+    pc = 0
+    end = len(code)
+    while pc < end:
+        op = code[pc]
+        if op == LOAD:
+            pc += 1
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        elif op != NEG:
+            # Every binary opcode pops two values and pushes one.
+            depth -= 1
+        pc += 1
+    return max_depth
 
-    Raises:
-        UnexpectedEndOfExpressionError: If there are unexpected tokens at the end of the expression.
-        UnexpectedTokenError: If there is an invalid token in the expression.
+
+def _run(code: Tuple[int, ...], consts: Tuple[float, ...], depth: int) -> float:
     """
-    base = _base(tokens)
+    Execute compiled postfix bytecode on a preallocated value stack.
 
-    match token := next(tokens, None):
-        case Operator("**") | Operator("^"):
-            return base ** _factor(tokens)
-        case None:
-            return base
-        case _:
-            tokens.reinsert(token)
-            return base
+    Args:
+        code (Tuple[int, ...]): The bytecode to execute.
+        consts (Tuple[float, ...]): The constants referenced by LOAD opcodes.
+        depth (int): The maximum stack depth the program reaches.
+
+    Returns:
+        float: The result of the executed program.
+    """
+    # The compiler knows the peak depth, so the stack never resizes: pushes
+    # and pops are plain index assignments.
+    stack = [0.0] * depth
+    top = -1
+    pc = 0
+    end = len(code)
+    while pc < end:
+        op = code[pc]
+        if op == LOAD:
+            pc += 1
+            top += 1
+            stack[top] = consts[code[pc]]
+        elif op == ADD:
+            right = stack[top]
+            top -= 1
+            stack[top] = stack[top] + right
+        elif op == SUB:
+            right = stack[top]
+            top -= 1
+            stack[top] = stack[top] - right
+        elif op == MUL:
+            right = stack[top]
+            top -= 1
+            stack[top] = stack[top] * right
+        elif op == DIV:
+            right = stack[top]
+            top -= 1
+            stack[top] = stack[top] / right
+        elif op == POW:
+            right = stack[top]
+            top -= 1
+            stack[top] = stack[top] ** right
+        else:  # NEG
+            stack[top] = -stack[top]
+        pc += 1
+    return stack[top]
 
 
-def _base(tokens: Tokenizer) -> float:
+def _parse(tokens: Tokenizer, code: list[int], consts: list[float]) -> None:
     """
-    Parse and evaluate a base value, which can be a number or a parenthesized expression.
+    Compile an expression with an iterative shunting-yard loop: values emit
+    immediately, operators wait on an explicit stack until an operator of
+    lower precedence (or the end of input) flushes them. No Python recursion
+    is involved, so input depth is unbounded.
 
     Args:
         tokens (TokenStream): An iterator of tokens representing the expression.
-
-    Returns:
-        float: The parsed base value.
+        code (list[int]): The bytecode being emitted.
+        consts (list[float]): The constants pool being emitted.
 
     Raises:
-        UnexpectedEndOfExpressionError: If there are unexpected tokens at the end of the expression.
-        UnexpectedTokenError: If there is an invalid token in the expression.
-    """
-    match token := next(tokens, None):
-        case Number(value=value):
-            return value
-        case Operator("-"):
-            return -_expression(tokens)
-        case Parenthesis("("):
-            value = _expression(tokens)
-            match token := next(tokens, None):
-                case Parenthesis(")"):
-                    return value
-                case None:
-                    raise UnexpectedEndOfExpressionError()
-                case _:
+        InvalidTokenError: If an invalid token is encountered.
+        UnexpectedEndOfExpressionError: If the expression ends unexpectedly.
+        UnexpectedTokenError: If a token appears where it is not expected.
+    """
+    # Pending operators as (precedence, right_assoc, opcode); None marks "(".
+    ops: list[tuple[int, bool, int] | None] = []
+    expect_operand = True
+
+    while True:
+        token = next(tokens, EOF)
+        kind = token.kind
+
+        if expect_operand:
+            if kind == KIND_NUMBER:
+                code.append(LOAD)
+                code.append(len(consts))
+                consts.append(token.value)
+                expect_operand = False
+            elif kind == KIND_OPERATOR and token.value == "-":
+                # Unary minus: right-associative so chained negations stack.
+                ops.append((_UNARY_PREC, True, NEG))
+            elif kind == KIND_PARENTHESIS and token.value == "(":
+                ops.append(None)
+            elif kind == KIND_EOF:
+                raise UnexpectedEndOfExpressionError()
+            elif kind == KIND_INVALID:
+                raise InvalidTokenError(token)
+            else:
+                raise UnexpectedTokenError(token)
+            continue
+
+        if kind == KIND_EOF:
+            break
+
+        if kind == KIND_OPERATOR:
+            prec, right_assoc, op = _BINARY_OPS[token.value]
+            while ops and (pending := ops[-1]) is not None:
+                if pending[0] > prec or (pending[0] == prec and not right_assoc):
+                    ops.pop()
+                    _emit_pending(code, consts, pending[2])
+                else:
+                    break
+            ops.append((prec, right_assoc, op))
+            expect_operand = True
+        elif kind == KIND_PARENTHESIS and token.value == ")":
+            while True:
+                if not ops:
+                    # Ran out of pending operators without finding the "(".
                     raise UnexpectedTokenError(token)
-        case None:
-            raise UnexpectedEndOfExpressionError()
-        case _:
+                pending = ops.pop()
+                if pending is None:
+                    break
+                _emit_pending(code, consts, pending[2])
+        elif kind == KIND_INVALID:
+            raise InvalidTokenError(token)
+        else:
             raise UnexpectedTokenError(token)
+
+    while ops:
+        pending = ops.pop()
+        if pending is None:
+            # An unclosed "(".
+            raise UnexpectedEndOfExpressionError()
+        _emit_pending(code, consts, pending[2])
+
+
+def _emit_pending(code: list[int], consts: list[float], op: int) -> None:
+    """Emit a pending opcode through the folding helpers."""
+    if op == NEG:
+        _emit_neg(code, consts)
+    else:
+        _emit_binary(code, consts, op)
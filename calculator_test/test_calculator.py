@@ -1,5 +1,5 @@
 import unittest
-from calculator import evaluate
+from calculator import evaluate, evaluate_compiled
 from calculator import (
     UnexpectedEndOfExpressionError,
     UnexpectedTokenError,
@@ -9,91 +9,97 @@ from tokenizer import InvalidTokenError
 
 # Test class
 class TestEvaluate(unittest.TestCase):
-    def test_simple_expressions(self):
-        self.assertEqual(evaluate("3 + 4 * 5 - 6 / 2"), 3 + 4 * 5 - 6 / 2)
-        self.assertEqual(evaluate("2 + 3"), 2 + 3)
-        self.assertEqual(evaluate("10 - 2 * 5"), 10 - 2 * 5)
-        self.assertEqual(evaluate("7"), 7)
+    # (expression, expected) pairs run under subTest: one method pays
+    # unittest's per-method overhead for the whole table, and individual
+    # failures still report the offending expression.
+    CASES = [
+        ("3 + 4 * 5 - 6 / 2", 3 + 4 * 5 - 6 / 2),
+        ("2 + 3", 2 + 3),
+        ("10 - 2 * 5", 10 - 2 * 5),
+        ("7", 7),
+        ("(3 + 4) * 5", (3 + 4) * 5),
+        ("2 * (3 + 4)", 2 * (3 + 4)),
+        ("(2 + 3) * (5 - 1)", (2 + 3) * (5 - 1)),
+        ("(7)", 7),
+        ("(-7)", -7),
+        ("-(7)", -7),
+        ("-3", -3),
+        ("-3 + 4", -3 + 4),
+        ("3 + -4", 3 + -4),
+        ("-3 * -4", -3 * -4),
+        ("3 * -4", 3 * -4),
+        ("-(-3)", -(-3)),
+        ("--3", 3),
+        ("3 + 4 * 5", 3 + 4 * 5),
+        ("2 ** 3 + 4", 2**3 + 4),
+        ("2 + 3 ** 2", 2 + 3**2),
+        ("2 * 3 ** 2", 2 * 3**2),
+        ("2 ** 3 * 2", 2**3 * 2),
+        ("2 ** 3 ** 2", 2**3**2),
+        ("2 ** (3 + 2)", 2 ** (3 + 2)),
+        ("(3 + 2) ** 2", (3 + 2) ** 2),
+        ("2 ** 3", 2**3),
+        ("2 ** (3 ** 2)", 2 ** (3**2)),
+        ("(2 ** 3) ** 2", (2**3) ** 2),
+        ("3-4", 3 - 4),
+        ("3--4", 3 - -4),
+        ("3- -4", 3 - -4),
+        ("-3-4", -3 - 4),
+        ("-3--4", -3 - -4),
+        ("-3- -4", -3 - -4),
+    ]
 
-    def test_parentheses(self):
-        self.assertEqual(evaluate("(3 + 4) * 5"), (3 + 4) * 5)
-        self.assertEqual(evaluate("2 * (3 + 4)"), 2 * (3 + 4))
-        self.assertEqual(evaluate("(2 + 3) * (5 - 1)"), (2 + 3) * (5 - 1))
-        self.assertEqual(evaluate("(7)"), 7)
-        self.assertEqual(evaluate("(-7)"), -7)
-        self.assertEqual(evaluate("-(7)"), -7)
+    # Float results compared with assertAlmostEqual.
+    FLOAT_CASES = [
+        ("1.5 + 2.5", 1.5 + 2.5),
+        ("1.5 * 2.5", 1.5 * 2.5),
+        ("1.5 / 2.5", 1.5 / 2.5),
+        ("1.5 ** 2.5", 1.5**2.5),
+    ]
 
-    def test_unary_negative(self):
-        self.assertEqual(evaluate("-3"), -3)
-        self.assertEqual(evaluate("-3 + 4"), -3 + 4)
-        self.assertEqual(evaluate("3 + -4"), 3 + -4)
-        self.assertEqual(evaluate("-3 * -4"), -3 * -4)
-        self.assertEqual(evaluate("3 * -4"), 3 * -4)
-        self.assertEqual(evaluate("-(-3)"), -(-3))
-        self.assertEqual(evaluate("--3"), 3)
+    # (expression, expected exception) pairs.
+    ERROR_CASES = [
+        ("3 + 4 & 5", InvalidTokenError),
+        ("+ 4", UnexpectedTokenError),
+        ("3 +", UnexpectedEndOfExpressionError),
+        ("3 + 4 )", UnexpectedTokenError),
+        ("(3 + 4) 3", UnexpectedTokenError),
+        ("3 / 0", ZeroDivisionError),
+        ("3 + 4 $$$$$$ 10 + 5", InvalidTokenError),
+        ("(3 + 4", UnexpectedEndOfExpressionError),  # Missing closing parenthesis
+        (")3 + 4(", UnexpectedTokenError),  # Unexpected close parenthesis
+        ("3 + (4 * (5 - 2", UnexpectedEndOfExpressionError),
+    ]
 
-    def test_order_of_operations(self):
-        self.assertEqual(evaluate("3 + 4 * 5"), 3 + 4 * 5)
-        self.assertEqual(evaluate("3 + 4 * 5 - 6 / 2"), 3 + 4 * 5 - 6 / 2)
-        self.assertEqual(evaluate("2 ** 3 + 4"), 2**3 + 4)
-        self.assertEqual(evaluate("2 + 3 ** 2"), 2 + 3**2)
-        self.assertEqual(evaluate("2 * 3 ** 2"), 2 * 3**2)
-        self.assertEqual(evaluate("2 ** 3 * 2"), 2**3 * 2)
-        self.assertEqual(evaluate("2 ** 3 ** 2"), 2**3**2)
-        self.assertEqual(evaluate("2 ** (3 + 2)"), 2 ** (3 + 2))
-        self.assertEqual(evaluate("(3 + 2) ** 2"), (3 + 2) ** 2)
+    def test_expressions(self):
+        for expression, expected in self.CASES:
+            with self.subTest(expr=expression):
+                self.assertEqual(evaluate(expression), expected)
 
-    def test_exponentiation(self):
-        self.assertEqual(evaluate("2 ** 3"), 2**3)
-        self.assertEqual(evaluate("2 ** 3 ** 2"), 2**3**2)
-        self.assertEqual(evaluate("2 ** (3 ** 2)"), 2 ** (3**2))
-        self.assertEqual(evaluate("(2 ** 3) ** 2"), (2**3) ** 2)
+    def test_float_expressions(self):
+        for expression, expected in self.FLOAT_CASES:
+            with self.subTest(expr=expression):
+                self.assertAlmostEqual(evaluate(expression), expected)
 
-    def test_invalid_token(self):
-        with self.assertRaises(InvalidTokenError):
-            evaluate("3 + 4 & 5")
-        with self.assertRaises(UnexpectedTokenError):
-            evaluate("+ 4")
-
-    def test_spaceless_negative(self):
-        self.assertEqual(evaluate("3-4"), 3 - 4)
-        self.assertEqual(evaluate("3--4"), 3 - -4)
-        self.assertEqual(evaluate("3- -4"), 3 - -4)
-        self.assertEqual(evaluate("-3-4"), -3 - 4)
-        self.assertEqual(evaluate("-3--4"), -3 - -4)
-        self.assertEqual(evaluate("-3- -4"), -3 - -4)
-
-    def test_float_math(self):
-        self.assertAlmostEqual(evaluate("1.5 + 2.5"), 1.5 + 2.5)
-        self.assertAlmostEqual(evaluate("1.5 * 2.5"), 1.5 * 2.5)
-        self.assertAlmostEqual(evaluate("1.5 / 2.5"), 1.5 / 2.5)
-        self.assertAlmostEqual(evaluate("1.5 ** 2.5"), 1.5**2.5)
+    def test_errors(self):
+        for expression, error in self.ERROR_CASES:
+            with self.subTest(expr=expression):
+                with self.assertRaises(error):
+                    evaluate(expression)
 
-    def test_invalid_expression(self):
+    def test_compiled_matches_interpreter(self):
+        for expression in (
+            "3 + 4 * 5 - 6 / 2",
+            "(2 + 3) * (5 - 1)",
+            "2 ** 3 ** 2",
+            "2 ^ 3",
+            "-2 ** 2",
+            "- 2 ** 2",
+            "3--4",
+            "1.5 ** 2.5",
+        ):
+            self.assertEqual(evaluate_compiled(expression), evaluate(expression))
         with self.assertRaises(UnexpectedEndOfExpressionError):
-            evaluate("3 +")
+            evaluate_compiled("3 +")
         with self.assertRaises(InvalidTokenError):
-            evaluate("3 + 4 & 5")
-        with self.assertRaises(UnexpectedTokenError):
-            evaluate("+ 4")
-        with self.assertRaises(UnexpectedTokenError):
-            evaluate("3 + 4 )")
-        with self.assertRaises(UnexpectedTokenError):
-            evaluate("(3 + 4) 3")
-
-    def test_divide_by_zero(self):
-        with self.assertRaises(ZeroDivisionError):
-            evaluate("3 / 0")
-
-    def test_long_invalid_token(self):
-        expression = "3 + 4 $$$$$$ 10 + 5"
-        with self.assertRaises(InvalidTokenError):
-            evaluate(expression)
-
-    def test_mismatched_parentheses(self):
-        with self.assertRaises(UnexpectedEndOfExpressionError):
-            evaluate("(3 + 4")  # Missing closing parenthesis
-        with self.assertRaises(UnexpectedTokenError):
-            evaluate(")3 + 4(")  # Unexpected close parenthesis
-        with self.assertRaises(UnexpectedEndOfExpressionError):
-            evaluate("3 + (4 * (5 - 2")  # Missing closing parenthesis
+            evaluate_compiled("3 + 4 & 5")
@@ -1,13 +1,16 @@
-from calculator.tokenizer import UnexpectedEndOfExpressionError
-from .tokenizer import Operator, Tokenizer
+from .tokenizer import Tokenizer
 from tokenizer import (
+    KIND_INVALID,
+    KIND_NUMBER,
+    KIND_OPERATOR,
     Invalid,
     InvalidTokenError,
-    Number,
+    UnexpectedEndOfExpressionError,
     UnexpectedTokenError,
 )
-from collections import deque
-from typing import Deque
+from functools import lru_cache
+from typing import Tuple
+import re
 
 # context-free grammar for reverse polish notation
 
@@ -15,6 +18,25 @@ from typing import Deque
 #    operand -> "+" | "-" | "*" | "/"
 #     number -> FLOAT_PATTERN
 
+# Expressions compile to a flat postfix bytecode: LOAD is followed by an index
+# into the constants tuple, every other opcode pops two values and pushes the
+# result. Compilation is memoized per expression string so repeated
+# evaluations skip tokenization entirely.
+LOAD, ADD, SUB, MUL, DIV = range(5)
+
+# Binary operator symbols map straight to their opcodes; a single dict probe
+# replaces the four-way branch in the compile loop.
+_OPCODES = {"+": ADD, "-": SUB, "*": MUL, "/": DIV}
+
+# Every character a valid expression can contain. Longer inputs are rejected
+# with one C-level sweep before tokenization; short ones aren't worth the
+# extra pass.
+_VALID_CHARS = re.compile(r"[\s0-9.+\-*/eE]*", re.ASCII)
+
+# Bytecode, constants, and the maximum value-stack depth the program reaches,
+# so _run can preallocate its stack instead of growing it per push.
+Program = Tuple[Tuple[int, ...], Tuple[float, ...], int]
+
 
 def evaluate(expression: str) -> float:
     """
@@ -31,29 +53,95 @@ def evaluate(expression: str) -> float:
         UnexpectedTokenError: If we encounter a token where it's not expected (i.e. insufficient values for operation).
         UnexpectedEndOfExpressionError: If the expression ends unexpectedly (i.e. unprocessed values).
     """
+    return _run(*_compile(expression))
+
+
+@lru_cache(maxsize=1024)
+def _compile(expression: str) -> Program:
+    """
+    Compile an expression into postfix bytecode, memoized per expression string.
 
-    values: Deque[float] = deque()
+    Args:
+        expression (str): The arithmetic expression to compile.
+
+    Returns:
+        Program: The bytecode and its constants tuple.
+
+    Raises:
+        InvalidTokenError: If an invalid token is encountered.
+        UnexpectedTokenError: If we encounter a token where it's not expected (i.e. insufficient values for operation).
+        UnexpectedEndOfExpressionError: If the expression ends unexpectedly (i.e. unprocessed values).
+    """
+    if len(expression) >= 32:
+        end = _VALID_CHARS.match(expression).end()
+        if end != len(expression):
+            raise InvalidTokenError(Invalid(expression[end], end, end + 1))
+    code: list[int] = []
+    consts: list[float] = []
+    depth = 0
+    max_depth = 0
     for token in Tokenizer(expression):
-        match token:
-            case Number(value):
-                values.append(value)
-            case Operator(operator) if len(values) >= 2:
-                right, left = values.pop(), values.pop()
-                match operator:
-                    case "+":
-                        values.append(left + right)
-                    case "-":
-                        values.append(left - right)
-                    case "*":
-                        values.append(left * right)
-                    case "/":
-                        values.append(left / right)
-            case Invalid():
-                raise InvalidTokenError(token)
-            case _:
-                raise UnexpectedTokenError(token)
-
-    if len(values) != 1:
+        kind = token.kind
+        if kind == KIND_NUMBER:
+            code.append(LOAD)
+            code.append(len(consts))
+            consts.append(token.value)
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        elif kind == KIND_OPERATOR and depth >= 2:
+            code.append(_OPCODES[token.value])
+            depth -= 1
+        elif kind == KIND_INVALID:
+            raise InvalidTokenError(token)
+        else:
+            raise UnexpectedTokenError(token)
+
+    if depth != 1:
         raise UnexpectedEndOfExpressionError()
 
-    return values.pop()
+    return tuple(code), tuple(consts), max_depth
+
+
+def _run(code: Tuple[int, ...], consts: Tuple[float, ...], depth: int) -> float:
+    """
+    Execute compiled postfix bytecode on a preallocated value stack.
+
+    Args:
+        code (Tuple[int, ...]): The bytecode to execute.
+        consts (Tuple[float, ...]): The constants referenced by LOAD opcodes.
+        depth (int): The maximum stack depth the program reaches.
+
+    Returns:
+        float: The result of the executed program.
+    """
+    # The compiler knows the peak depth, so the stack never resizes: pushes
+    # and pops are plain index assignments.
+    stack = [0.0] * depth
+    top = -1
+    pc = 0
+    end = len(code)
+    while pc < end:
+        op = code[pc]
+        if op == LOAD:
+            pc += 1
+            top += 1
+            stack[top] = consts[code[pc]]
+        elif op == ADD:
+            right = stack[top]
+            top -= 1
+            stack[top] = stack[top] + right
+        elif op == SUB:
+            right = stack[top]
+            top -= 1
+            stack[top] = stack[top] - right
+        elif op == MUL:
+            right = stack[top]
+            top -= 1
+            stack[top] = stack[top] * right
+        else:  # DIV
+            right = stack[top]
+            top -= 1
+            stack[top] = stack[top] / right
+        pc += 1
+    return stack[top]
@@ -1,7 +1,10 @@
 import re
-from typing import Final, Iterator, Literal, Tuple, final, get_args, cast
+import sys
+from functools import lru_cache
+from typing import Final, Literal, Tuple, Type, final, get_args
 from tokenizer import (
     FLOAT_PATTERN,
+    KIND_OPERATOR,
     Number,
     Token,
     TokenStream,
@@ -10,40 +13,104 @@ from tokenizer import (
 
 Operators = Literal["+", "-", "*", "/"]
 
+# typing introspection is surprisingly costly; walk the Literal exactly once
+# at import and reuse the tuple everywhere.
+_OPERATORS: Final[Tuple[str, ...]] = get_args(Operators)
 
-class Operator(Token[Operators]): ...
+
+class Operator(Token[Operators]):
+    __slots__ = ()
+    kind = KIND_OPERATOR
 
 
 TokenType = Number | Operator | Invalid
 
+# Constructor lookup for non-number tokens: the matched text itself picks the
+# token class, so classification is a single dict probe per match.
+_CTOR: dict[str, Type[TokenType]] = {op: Operator for op in _OPERATORS}
+
+# Interned singletons for the symbol alphabet: token values share one str
+# object per symbol, so consumer comparisons hit the identity fast path and
+# match.group()'s fresh substring is dropped immediately.
+_INTERN: dict[str, str] = {s: sys.intern(s) for s in _CTOR}
+
+@lru_cache(maxsize=512)
+def _to_float(literal: str) -> float:
+    """Convert a numeric literal to a float, caching repeated literals."""
+    return float(literal)
+
+
+# Precomputed floats for common small integer literals, probed before the
+# general conversion path — analogous to CPython's small-int cache.
+_SMALL_FLOATS: Final[dict[str, float]] = {str(i): float(i) for i in range(-128, 257)}
+
+
+def _emit_number(tok: str, start: int, end: int) -> TokenType:
+    value = _SMALL_FLOATS.get(tok)
+    if value is None:
+        value = _to_float(tok)
+    return Number(value, start, end)
+
+
+def _emit_symbol(tok: str, start: int, end: int) -> TokenType:
+    # Anything that isn't a known operator is invalid.
+    return _CTOR.get(tok, Invalid)(_INTERN.get(tok, tok), start, end)
+
+
+# The grammar, compiled once at module scope. It is a bit simpler than the
+# calculator's, as it does require spaces. It cannot afford ambiguity with
+# leading operators.
+#   e.g. "1 + 2 -3 4" cannot be easily disambiguated from "1 + 2 - 3 4" without fully parsing the expression.
+# Whitespace leads the alternation: it is the most frequent match in this
+# space-separated grammar, and number must stay ahead of operator so signed
+# literals win over a bare sign.
+_GRAMMAR = re.compile(
+    r"(?:(?P<ws>\s+)"
+    rf"|(?P<number>{FLOAT_PATTERN.pattern})"
+    r"|(?P<operator>[+\-*/]))",
+    re.ASCII,
+)
+
+# Bound method, hoisted so _tokenize skips the attribute lookup per call.
+_FINDITER = _GRAMMAR.finditer
+
+# Per-group emit handlers indexed by Match.lastindex: an integer compare and a
+# tuple index replace the group-name lookup per match.
+_WS_INDEX = _GRAMMAR.groupindex["ws"]
+_HANDLERS: tuple = tuple(
+    {
+        _GRAMMAR.groupindex["number"]: _emit_number,
+        _GRAMMAR.groupindex["operator"]: _emit_symbol,
+    }.get(index)
+    for index in range(_GRAMMAR.groups + 1)
+)
+
 
 @final
 class Tokenizer(TokenStream[TokenType]):
-    # this grammar is a bit simpler, as it does require spaces. It cannot afford ambiguity with leading operators.
-    #   e.g. "1 + 2 -3 4" cannot be easily disambiguated from "1 + 2 - 3 4" without fully parsing the expression.
-    GRAMMAR: Final[re.Pattern[str]] = re.compile(
-        rf"""
-        (?:
-            (?P<number>{FLOAT_PATTERN.pattern})
-            |
-            (?P<operator>[+\-*/])
-            |
-            (?P<invalid>\S+)
-        )
-    """,
-        re.VERBOSE,
-    )
-
-    OPERATORS: Final[Tuple[str, ...]] = get_args(Operators)
-
-    def _tokenize(self, expression: str) -> Iterator[TokenType]:
-        for match in Tokenizer.GRAMMAR.finditer(expression):
+    __slots__ = ()
+
+    GRAMMAR: Final[re.Pattern[str]] = _GRAMMAR
+
+    OPERATORS: Final[Tuple[str, ...]] = _OPERATORS
+
+    def _tokenize(self, expression: str) -> list[TokenType]:
+        if expression.isascii() and expression.isdigit():
+            # A bare integer literal: skip the regex engine entirely.
+            return [_emit_number(expression, 0, len(expression))]
+        tokens: list[TokenType] = []
+        append = tokens.append
+        pos = 0
+        for match in _FINDITER(expression):
             start, end = match.span()
-            val = match.group()
-            match match.lastgroup:
-                case "number":
-                    yield Number(float(val), start, end)
-                case "operator" if val in Tokenizer.OPERATORS:
-                    yield Operator(cast(Operators, val), start, end)
-                case _:
-                    yield Invalid(val, start, end)
+            if start > pos:
+                # Text no alternative claims surfaces as a gap between
+                # matches: that gap is the invalid token.
+                append(Invalid(expression[pos:start], pos, start))
+            pos = end
+            if (index := match.lastindex) == _WS_INDEX:
+                continue
+            append(_HANDLERS[index](match.group(), start, end))
+        if pos < len(expression):
+            append(Invalid(expression[pos:], pos, len(expression)))
+        return tokens
@@ -1,61 +1,136 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 import re
-from typing import Any, Generic, TypeVar, Iterator
+from typing import Any, ClassVar, Generic, TypeVar
 
 SymbolLiteral = TypeVar("SymbolLiteral")
 
+# Integer kind tags, set class-level on each Token subclass: parsers dispatch
+# on a single int compare instead of class identity checks.
+KIND_NUMBER, KIND_OPERATOR, KIND_PARENTHESIS, KIND_INVALID, KIND_EOF = range(5)
+
 
 # Define the token classes
-@dataclass(frozen=True)
 class Token(ABC, Generic[SymbolLiteral]):
     """
     A token representing a single element in a language.
 
+    Token construction is the tokenizer's inner-loop allocation, so this is a
+    hand-written slots class rather than a frozen dataclass: a plain __init__
+    stores three attributes directly instead of routing each through
+    object.__setattr__.
+
     Args:
         value (SymbolLiteral): The value of the token.
         start (int): The starting index of the token in the expression.
         end (int): The ending index of the token in the expression.
     """
 
+    __slots__ = ("value", "start", "end")
+    __match_args__ = ("value", "start", "end")
+
+    kind: ClassVar[int] = -1
+
     value: SymbolLiteral
     start: int
     end: int
 
-    def __post_init__(self):
-        if self.end < self.start:
+    def __init__(self, value: SymbolLiteral, start: int, end: int):
+        # Spans from Match.span() are monotonic by construction; the check
+        # only guards hand-built tokens, so let python -O elide it.
+        if __debug__ and end < start:
             raise ValueError("End index cannot be less than start index")
+        self.value = value
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}"
+            f"(value={self.value!r}, start={self.start}, end={self.end})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            type(other) is type(self)
+            and other.value == self.value
+            and other.start == self.start
+            and other.end == self.end
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.value, self.start, self.end))
 
 
 TokenizedLiteral = TypeVar("TokenizedLiteral", bound=Token[Any])
 
+# Tokenized expressions keyed by (stream class, expression). Tokens are
+# immutable, so the tuples are safely shared between streams; a plain dict
+# cleared when full beats lru_cache here because _tokenize is an instance
+# method and caching through it would pin stream instances alive.
+_TOKEN_CACHE: dict[tuple[type, str], tuple[Token[Any], ...]] = {}
+_TOKEN_CACHE_LIMIT = 4096
+
 
 class TokenStream(ABC, Generic[TokenizedLiteral]):
-    _tokens: Iterator[TokenizedLiteral]
+    # Tokens are materialized eagerly; expressions are small, and list indexing
+    # through a cursor is much cheaper than resuming a generator per token.
+    __slots__ = ("_tokens", "_index")
+
+    _tokens: tuple[TokenizedLiteral, ...]
+    _index: int
 
     def __init__(self, expression: str):
-        self._tokens = self._tokenize(expression)
+        key = (type(self), expression)
+        tokens = _TOKEN_CACHE.get(key)
+        if tokens is None:
+            if len(_TOKEN_CACHE) >= _TOKEN_CACHE_LIMIT:
+                _TOKEN_CACHE.clear()
+            tokens = _TOKEN_CACHE[key] = tuple(self._tokenize(expression))
+        self._tokens = tokens
+        self._index = 0
 
     def __iter__(self) -> "TokenStream[TokenizedLiteral]":
         return self
 
     def __next__(self) -> TokenizedLiteral:
-        return next(self._tokens)
+        index = self._index
+        tokens = self._tokens
+        if index >= len(tokens):
+            raise StopIteration
+        self._index = index + 1
+        return tokens[index]
 
     @abstractmethod
-    def _tokenize(self, expression: str) -> Iterator[TokenizedLiteral]:
+    def _tokenize(self, expression: str) -> list[TokenizedLiteral]:
         raise NotImplementedError
 
 
 # common ones
 
-FLOAT_PATTERN = re.compile(r"[-+]?\d*\.?\d+([eE][-+]?\d+)?")
+# The exponent group is non-capturing so embedding patterns keep stable group
+# numbering (dispatch on Match.lastindex relies on it). ASCII keeps \d to byte
+# range checks instead of Unicode category lookups.
+FLOAT_PATTERN = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?", re.ASCII)
+
+
+class Number(Token[float]):
+    __slots__ = ()
+    kind = KIND_NUMBER
+
 
+class Invalid(Token[str]):
+    __slots__ = ()
+    kind = KIND_INVALID
 
-class Number(Token[float]): ...
 
+class _Eof(Token[None]):
+    __slots__ = ()
+    kind = KIND_EOF
 
-class Invalid(Token[str]): ...
+
+# Singleton handed out in place of None at end of stream, so parsers fold the
+# end-of-input case into the same kind switch as real tokens.
+EOF = _Eof(None, 0, 0)
 
 
 # errors
@@ -75,3 +150,8 @@ class InvalidTokenError(TokenError):
 class UnexpectedTokenError(TokenError):
     def __init__(self, token: Token[Any]):
         super().__init__("Unexpected token", token)
+
+
+class UnexpectedEndOfExpressionError(ValueError):
+    def __init__(self):
+        super().__init__("Unexpected end of expression")